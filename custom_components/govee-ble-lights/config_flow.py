@@ -29,6 +29,11 @@ from homeassistant.data_entry_flow import FlowResult
 
 from .const import DOMAIN, CONF_TYPE_BLE
 
+# Configuration types offered in the user step, and the (input independent)
+# schema for that form
+_CONFIG_TYPES = {CONF_TYPE_BLE: "BLE"}
+_USER_SCHEMA = vol.Schema({vol.Required(CONF_TYPE): vol.In(_CONFIG_TYPES)})
+
 
 class GoveeConfigFlow(ConfigFlow, domain=DOMAIN):
     """
@@ -49,13 +54,16 @@ class GoveeConfigFlow(ConfigFlow, domain=DOMAIN):
         _discovered_device: Current device name from discovery
         _discovered_devices: Dictionary of discovered devices and their names
         _available_models: List of available Govee light models
-        _available_config_types: Dictionary of available configuration types
     """
 
     # Version number for this configuration flow
     # Used to determine when configuration entries need to be migrated
     VERSION = 1
 
+    # Bundled model names, read from the jsons directory by the first flow that
+    # needs them and shared by all later flows. See _async_load_models.
+    _model_cache: list[str] | None = None
+
     def __init__(self) -> None:
         """
         Initialize the configuration flow.
@@ -69,16 +77,12 @@ class GoveeConfigFlow(ConfigFlow, domain=DOMAIN):
             _discovered_device: Will store the discovered device name
             _discovered_devices: Will store discovered devices dictionary
             _available_models: Will store available Govee models
-            _available_config_types: Will store available config types
         """
         self._config_type: str = ""
         self._discovery_info: None = None
         self._discovered_device: None = None
         self._discovered_devices: dict[str, str] = {}
         self._available_models: list[str] = []
-        self._available_config_types: dict[str, str] = {
-            CONF_TYPE_BLE: "BLE",
-        }
 
     async def _async_load_models(self) -> None:
         """
@@ -89,8 +93,9 @@ class GoveeConfigFlow(ConfigFlow, domain=DOMAIN):
         and other model-specific data for different Govee light products.
 
         The loading is done using an executor to avoid blocking the Home
-        Assistant main thread. Models are loaded once and cached in
-        _available_models for subsequent use.
+        Assistant main thread. The bundled files never change at runtime, so
+        the directory is only read once per process; later flows reuse the
+        class-level cache.
 
         Args:
             self: Configuration flow instance
@@ -102,14 +107,19 @@ class GoveeConfigFlow(ConfigFlow, domain=DOMAIN):
         if self._available_models:
             return
 
-        # Get path of bundled JSON files.
-        # The jsons directory is located alongside this config_flow.py file
-        jsons_path = Path(Path(__file__).parent / "jsons")
+        if GoveeConfigFlow._model_cache is None:
+            # Get path of bundled JSON files.
+            # The jsons directory is located alongside this config_flow.py file
+            jsons_path = Path(Path(__file__).parent / "jsons")
 
-        files = await self.hass.async_add_executor_job(
-            lambda: list(jsons_path.iterdir())
-        )
-        self._available_models = sorted(f.name.replace(".json", "") for f in files)
+            files = await self.hass.async_add_executor_job(
+                lambda: list(jsons_path.iterdir())
+            )
+            GoveeConfigFlow._model_cache = sorted(
+                f.name.replace(".json", "") for f in files
+            )
+
+        self._available_models = GoveeConfigFlow._model_cache
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -332,10 +342,5 @@ class GoveeConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user",
             # Schema defines configuration type dropdown
-            data_schema=vol.Schema(
-                {
-                    # Dropdown of available configuration types
-                    vol.Required(CONF_TYPE): vol.In(self._available_config_types),
-                }
-            ),
+            data_schema=_USER_SCHEMA,
         )
@@ -17,12 +17,14 @@ Good reference: https://github.com/egold555/Govee-Reverse-Engineering/blob/maste
 """
 
 from enum import IntEnum
+from functools import lru_cache
 import asyncio
 import logging
-import array
+import weakref
 
 import bleak_retry_connector as brc
 from bleak import BleakClient
+from bleak.exc import BleakError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -112,25 +114,56 @@ class GoveeBLE:
     # Models that use segmented LED strips (multiple colors in one strip)
     # These devices require special multi-packet commands when controlling specific segments.
     # Ignore for now.
-    BLE_SEGMENTED_MODELS = [
-        "H6053",
-        "H6072",
-        "H6102",
-        "H6199",
-        "H617A",
-        "H617C",
-        "H617E",
-        "H618C",
-    ]
+    BLE_SEGMENTED_MODELS = frozenset(
+        {
+            "H6053",
+            "H6072",
+            "H6102",
+            "H6199",
+            "H617A",
+            "H617C",
+            "H617E",
+            "H618C",
+        }
+    )
 
     # Models that expect brightness as percentage (0-100) instead of 0-255
-    BLE_PERCENT_MODELS = ["H6199", "H617A", "H617C", "H618C"]
+    BLE_PERCENT_MODELS = frozenset({"H6199", "H617A", "H617C", "H618C"})
 
     # BLE connection and packet timing parameters
     BLE_KEEPALIVE_INTERVAL = 1.0  # Seconds between keepalive packets
     BLE_INTERFRAME_DELAY = 0.05  # Seconds delay between frames in multi-packet
     BLE_HANDLE_RETRY = 3  # Number of connection retry attempts
     BLE_TIMEOUT = 7  # Timeout in seconds for operations
+    BLE_BUSY_RETRY_DELAY = 0.02  # Seconds to wait before retrying a busy write
+
+    # Event loop time of the last successful write per client.
+    # The keepalive loop uses it to stay quiet while commands are being sent.
+    _LAST_WRITE: "weakref.WeakKeyDictionary[BleakClient, float]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    # Cache of (initial, additional) 20-byte templates for multi-packet frames,
+    # keyed by protocol type. See _multi_packet_scaffold.
+    _MULTI_PACKET_SCAFFOLDS: dict[int, tuple[bytes, bytes]] = {}
+
+    @staticmethod
+    def _multi_packet_scaffold(protocol_type) -> tuple[bytes, bytes]:
+        """
+        Return the static (initial, additional) frame templates for a protocol type.
+
+        The initial frame starts with protocol_type, sequence number 0 and flags 1.
+        The additional frame starts with protocol_type and the 0xFF sequence flag.
+        Everything else is zero and filled in per call by send_multi_packet.
+        """
+        scaffold = GoveeBLE._MULTI_PACKET_SCAFFOLDS.get(protocol_type)
+        if scaffold is None:
+            scaffold = (
+                bytes([protocol_type, 0, 1] + [0] * 17),
+                bytes([protocol_type, 255] + [0] * 18),
+            )
+            GoveeBLE._MULTI_PACKET_SCAFFOLDS[protocol_type] = scaffold
+        return scaffold
 
     @staticmethod
     async def send_multi_packet(client: BleakClient, protocol_type, header_array, data):
@@ -165,84 +198,75 @@ class GoveeBLE:
            - Create additional packet(s) for overflow
            - Each chunk gets its own sequence number
 
-        3. Calculate XOR checksum for each packet
+        3. Calculate XOR checksum for each packet in one pass
 
-        4. Send each packet sequentially with 50ms delay between them
+        4. Send each packet sequentially (write without response) with a
+           BLE_INTERFRAME_DELAY gap between consecutive packets
 
         Note: The implementation references Jaano's govee_lights project for verification.
         """
 
-        result = []
-
         # Initialize the initial buffer (20 bytes total)
         header_length = len(header_array)
         header_offset = header_length + 4
 
-        initial_buffer = array.array("B", [0] * 20)
-        initial_buffer[0] = protocol_type
-        initial_buffer[1] = 0
-        initial_buffer[2] = 1
+        initial_scaffold, additional_scaffold = GoveeBLE._multi_packet_scaffold(
+            protocol_type
+        )
+        initial_buffer = bytearray(initial_scaffold)
         initial_buffer[4 : 4 + header_length] = header_array
 
         # Create the additional buffer for overflow data
-        additional_buffer = array.array("B", [0] * 20)
-        additional_buffer[0] = protocol_type
-        additional_buffer[1] = 255  # Flag for additional packet
+        additional_buffer = bytearray(additional_scaffold)
 
         remaining_space = 14 - header_length + 1
 
         # Check if data fits in initial buffer
         if len(data) <= remaining_space:
-            # Data fits - just copy it into the initial buffer
+            # Data fits - just copy it into the initial buffer. The device still
+            # expects the (empty) additional buffer, so exactly two frames are sent.
             initial_buffer[header_offset : header_offset + len(data)] = data
+            result = [initial_buffer, additional_buffer]
         else:
             # Data is too large - must chunk it
-            excess = len(data) - remaining_space
-            # Calculate number of 17-byte chunks needed
-            chunks = excess // 17
-            remainder = excess % 17
-
-            # If there's a remainder, we need one more chunk
-            if remainder > 0:
-                chunks += 1
-            else:
-                # Edge case: exact division, still need to account for it
-                remainder = 17
+            result = [initial_buffer]
 
             # Copy first chunk into initial buffer
             initial_buffer[header_offset : header_offset + remaining_space] = data[
                 0:remaining_space
             ]
-            current_index = remaining_space
+
+            # The overflow is split into 17-byte chunks, one per start offset.
+            # Only the last chunk may be shorter than 17 bytes.
+            offsets = range(remaining_space, len(data), 17)
+            chunks = len(offsets)
 
             # Create additional chunks for overflow data
-            for i in range(1, chunks + 1):
-                # Create a 17-byte chunk
-                chunk = array.array("B", [0] * 17)
-                chunk_size = remainder if i == chunks else 17
-                chunk[0:chunk_size] = data[current_index : current_index + chunk_size]
-                current_index += chunk_size
+            for i, current_index in enumerate(offsets, 1):
+                # Slice the next (up to) 17 bytes of data for this chunk
+                chunk = data[current_index : current_index + 17]
 
                 # For the last chunk, add to additional buffer
                 if i == chunks:
-                    additional_buffer[2 : 2 + chunk_size] = chunk[0:chunk_size]
+                    additional_buffer[2 : 2 + len(chunk)] = chunk
                 else:
                     # For intermediate chunks, create a full packet buffer
-                    chunk_buffer = array.array("B", [0] * 20)
+                    chunk_buffer = bytearray(20)
                     chunk_buffer[0] = protocol_type
                     chunk_buffer[1] = i  # Sequence number for this chunk
-                    chunk_buffer[2 : 2 + chunk_size] = chunk
-                    chunk_buffer[19] = GoveeBLE.sign_payload(chunk_buffer[0:19])
+                    chunk_buffer[2:19] = chunk
                     result.append(chunk_buffer)
 
-        # Calculate total packet count including additional buffer
-        initial_buffer[3] = len(result) + 2
-        initial_buffer[19] = GoveeBLE.sign_payload(initial_buffer[0:19])
-        result.insert(0, initial_buffer)
+            # Additional buffer for final overflow chunk
+            result.append(additional_buffer)
 
-        # Additional buffer for final overflow chunk
-        additional_buffer[19] = GoveeBLE.sign_payload(additional_buffer[0:19])
-        result.append(additional_buffer)
+        # Store the total packet count, including initial and additional buffers
+        initial_buffer[3] = len(result)
+
+        # Sign every frame in a single pass once all of them are assembled
+        sign_payload = GoveeBLE.sign_payload
+        for frame in result:
+            frame[19] = sign_payload(frame[0:19])
 
         # https://github.com/Jaano/govee_lights/commit/a9ded50ca6b341a30a02aaf22970f4b8be28d871#diff-cb5033302ec76b56b44c29678bc2d1f03472d762cae718fe31cb8d934eb447b7R161
         for i, r in enumerate(result):
@@ -250,10 +274,33 @@ class GoveeBLE:
                 "Sending multi-packet frame %d/%d: %s",
                 i + 1,
                 len(result),
-                r.tobytes().hex(),
+                r.hex(),
             )
+            # Frames must arrive in sequence, so they are written one after
+            # another rather than gathered; only the gaps between frames wait.
+            if i:
+                await asyncio.sleep(GoveeBLE.BLE_INTERFRAME_DELAY)
             await GoveeBLE.send_single_frame(client, r)
-            await asyncio.sleep(0.05)
+
+    @staticmethod
+    async def send_frames(client: BleakClient, frames) -> None:
+        """
+        Sends several pre-made single frames to a Govee device back-to-back.
+
+        Used when one Home Assistant call changes several attributes at once
+        (e.g. power, brightness and color). All frames are built up front, then
+        each one is written and awaited in order, with no delay in between.
+
+        Args:
+            client: BleakClient instance connected to the Govee BLE device
+            frames: Signed 20-byte frames to write, in order
+
+        Returns:
+            None
+        """
+        send_single_frame = GoveeBLE.send_single_frame
+        for frame in frames:
+            await send_single_frame(client, frame)
 
     @staticmethod
     async def send_keepalive_packet(client: BleakClient):
@@ -281,24 +328,28 @@ class GoveeBLE:
         and checksum to keep the connection alive.
         """
 
-        # Start with the frame type byte
-        frame = bytes([0xAA])
+        # The keepalive frame never changes, so it is built once at import
+        # Note: We pass frame directly to send_single_frame with no response
+        await GoveeBLE.send_single_frame(client, KEEPALIVE_FRAME, False)
 
-        # Pad frame data to 19 bytes (plus checksum makes 20 total)
-        frame += bytes([0] * (19 - len(frame)))
+    @staticmethod
+    async def send_power(client: BleakClient, on: bool) -> None:
+        """
+        Sends a power on/off command to a Govee device.
 
-        # Calculate the XOR checksum of all data bytes
-        # This provides integrity verification for the packet
-        checksum = 0
-        for b in frame:
-            checksum ^= b
+        Args:
+            client: BleakClient instance connected to the Govee BLE device
+            on: True to turn the device on, False to turn it off
 
-        # Append the checksum byte to complete the frame
-        frame += bytes([GoveeBLE.sign_payload(frame)])
+        Returns:
+            None
 
-        # Send the frame without expecting a response
-        # Note: We pass frame directly to send_single_frame with no response
-        await GoveeBLE.send_single_frame(client, frame, False)
+        Uses the prebuilt POWER_ON_FRAME/POWER_OFF_FRAME instead of
+        building and signing a new packet for every call.
+        """
+        await GoveeBLE.send_single_frame(
+            client, POWER_ON_FRAME if on else POWER_OFF_FRAME
+        )
 
     @staticmethod
     async def send_single_packet(
@@ -308,8 +359,8 @@ class GoveeBLE:
         Creates, signs, and sends a complete BLE packet to a Govee device.
 
         This is the primary method for sending commands to control lights.
-        It handles validation, packet construction, checksum calculation,
-        and transmission via GATT characteristic write.
+        The frame is built by prepare_single_packet and then transmitted
+        via GATT characteristic write.
 
         Args:
             client: BleakClient instance connected to the Govee BLE device
@@ -323,6 +374,28 @@ class GoveeBLE:
 
         Returns:
             None
+        """
+        frame = GoveeBLE.prepare_single_packet(cmd, payload, frame_type)
+
+        # Send the frame with debug logging
+        await GoveeBLE.send_single_frame(client, frame)
+
+    @staticmethod
+    def prepare_single_packet(cmd, payload, frame_type=LEDFrameType.COMMAND):
+        """
+        Creates and signs a complete 20-byte BLE packet without sending it.
+
+        Args:
+            cmd: Command byte (LEDCommand enum value like POWER=0x01, BRIGHTNESS=0x04)
+            payload: Data bytes for the command (bytes, list of ints, or empty for requests)
+            frame_type: 0xAA for request (device responds) or 0x33 for command (device executes)
+                Defaults to COMMAND for normal operation
+
+        Raises:
+            ValueError: If cmd is not an int, payload is invalid, or payload > 17 bytes
+
+        Returns:
+            bytearray: The signed frame
 
         The packet structure:
 
@@ -338,39 +411,69 @@ class GoveeBLE:
         if not isinstance(cmd, int):
             raise ValueError("Invalid command")
 
-        # Validate payload type and content
-        if not isinstance(payload, bytes) and not (
-            isinstance(payload, list) and all(isinstance(x, int) for x in payload)
-        ):
-            raise ValueError("Invalid payload")
+        # Bytes-like payloads are used as-is; anything else (e.g. a list of
+        # ints) is converted once, which also rejects non-byte values
+        if not isinstance(payload, (bytes, bytearray, memoryview)):
+            if isinstance(payload, int):
+                raise ValueError("Invalid payload")
+            try:
+                payload = bytes(payload)
+            except (TypeError, ValueError) as err:
+                raise ValueError("Invalid payload") from err
 
         # Payload must not exceed 17 bytes (plus checksum)
         if len(payload) > 17:
             raise ValueError("Payload too long")
 
-        # Convert command to single byte
-        cmd = cmd & 0xFF
-        # Convert payload to bytes if it's a list
-        payload = bytes(payload)
-
-        # Build the frame: frame type + command + payload
+        # Build the frame in a zero-filled 20-byte buffer: frame type + command + payload
         # The frame type determines if the device will respond or execute
-        frame = bytes([frame_type, cmd]) + bytes(payload)
+        frame = bytearray(20)
+        frame[0] = frame_type
+        frame[1] = cmd & 0xFF
+        frame[2 : 2 + len(payload)] = payload
 
-        # Pad frame data to 19 bytes (plus checksum makes 20 total)
-        frame += bytes([0] * (19 - len(frame)))
+        # Store the signed checksum byte to complete the frame
+        frame[19] = GoveeBLE.sign_payload(frame[:19])
+        return frame
 
-        # Calculate the XOR checksum of all data bytes
-        # This provides integrity verification for the packet
-        checksum = 0
-        for b in frame:
-            checksum ^= b
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def prepare_color_packet(red, green, blue, segmented=False) -> bytes:
+        """
+        Creates and signs a color command frame, caching the result.
 
-        # Append the signed checksum byte to complete the frame
-        frame += bytes([GoveeBLE.sign_payload(frame)])
+        Color pickers and sliders tend to revisit the same colors, so frames
+        are memoized per (red, green, blue, segmented) and returned as
+        immutable bytes.
 
-        # Send the frame with debug logging
-        await GoveeBLE.send_single_frame(client, frame)
+        Args:
+            red: Red value (0-255)
+            green: Green value (0-255)
+            blue: Blue value (0-255)
+            segmented: Whether the device is in BLE_SEGMENTED_MODELS
+
+        Returns:
+            bytes: The signed frame
+        """
+        if segmented:
+            payload = [
+                MODE_SEGMENTS,
+                0x01,  # Segment index
+                red,
+                green,
+                blue,  # RGB values
+                0x00,
+                0x00,
+                0x00,
+                0x00,
+                0x00,  # Reserved
+                0xFF,  # Full intensity
+                0x7F,  # Segment count (default to all)
+            ]
+        else:
+            payload = [MODE_MANUAL, red, green, blue]
+
+        return bytes(GoveeBLE.prepare_single_packet(CMD_COLOR, payload))
 
     @staticmethod
     def verify_frame(frame):
@@ -434,6 +537,21 @@ class GoveeBLE:
         payload = frame[2:-1]  # Data payload (excluding checksum)
         return head, cmd, payload
 
+    @staticmethod
+    async def _connect_with_retry(client: BleakClient) -> None:
+        """
+        Reconnect a disconnected client, giving up after BLE_HANDLE_RETRY attempts.
+
+        Raises:
+            TimeoutError: If the client is still disconnected after all attempts
+        """
+        retry = 0
+        while not client.is_connected:
+            if retry >= GoveeBLE.BLE_HANDLE_RETRY:
+                raise TimeoutError
+            await client.connect()
+            retry += 1
+
     @staticmethod
     # Sends a single BLE data frame. log_frame indicates whether or not to log it.
     # Turn log_frame off when sending keepalive packets to prevent log spam.
@@ -455,62 +573,41 @@ class GoveeBLE:
 
         The method:
         1. Retries connection up to 3 times if client is disconnected
-        2. Writes the frame to the control characteristic
-        3. Logs the frame if logging is enabled
+        2. Logs the frame if logging is enabled
+        3. Writes the frame to the control characteristic, retrying briefly
+           if the adapter reports that another operation is in progress
 
         Note: This method expects the frame to be pre-built with proper
         checksum. Do not call directly unless you understand the protocol.
         """
-        retry = 0
-        # Retry connection if client is not connected
-        while not client.is_connected:
-            if retry >= GoveeBLE.BLE_HANDLE_RETRY:
-                raise TimeoutError
-            await client.connect()
-            retry += 1
+        # Retry connection if client is not connected. Checked inline so the
+        # already-connected path does not await the helper for every frame.
+        if not client.is_connected:
+            await GoveeBLE._connect_with_retry(client)
 
         # Log the frame if logging is enabled
         if log_frame:
             _LOGGER.debug("Writing frame: %s", bytes(frame).hex())
 
         # Write the frame to the control characteristic
-        # The False parameter indicates we're not expecting a response
-        await client.write_gatt_char(
-            GoveeBLE.BLE_UUID_CONTROL_CHARACTERISTIC, frame, False
-        )
-
-    @staticmethod
-    async def read_attribute(client: BleakClient, attribute: LEDCommand):
-        """
-        Attempts to read a device attribute via GATT characteristic read.
-
-        This method is used to read the value of a GATT characteristic
-        on the Govee device.
-
-        Args:
-            client: BleakClient instance connected to the Govee BLE device
-            attribute: LEDCommand type to read (POWER, BRIGHTNESS, COLOR, SEGMENT)
-
-        Returns:
-            The read attribute value or raises an exception
-
-        Raises:
-            Exception: If the read fails due to connection issues or
-                      unsupported characteristic type
-
-        Note: This method may not work for all device models as many
-        Govee BLE characteristics are write-only.
-        """
-        retry = 0
-        # Retry connection if client is not connected
-        while not client.is_connected:
-            if retry >= GoveeBLE.BLE_HANDLE_RETRY:
-                raise TimeoutError
-            await client.connect()
-            retry += 1
-
-        # Read the GATT characteristic
-        return await client.read_gatt_char(attribute)
+        # The False parameter indicates we're not expecting a response.
+        # Overlapping writes on one client (e.g. a command racing the keepalive
+        # task) fail with an "in progress" error. Those are retried on the same
+        # connection instead of being treated like a disconnect.
+        write = client.write_gatt_char
+        uuid = GoveeBLE.BLE_UUID_CONTROL_CHARACTERISTIC
+        for attempt in range(GoveeBLE.BLE_HANDLE_RETRY):
+            try:
+                await write(uuid, frame, False)
+                GoveeBLE._LAST_WRITE[client] = asyncio.get_running_loop().time()
+                return
+            except BleakError as err:
+                if (
+                    "in progress" not in str(err).lower()
+                    or attempt == GoveeBLE.BLE_HANDLE_RETRY - 1
+                ):
+                    raise
+                await asyncio.sleep(GoveeBLE.BLE_BUSY_RETRY_DELAY)
 
     @staticmethod
     async def create_connection(ble_device, identifier, hass) -> BleakClient:
@@ -530,7 +627,7 @@ class GoveeBLE:
             BleakClient: Connected BleakClient instance
 
         The method:
-        1. Uses bleak_retry_connector to establish connection
+        1. Uses bleak_retry_connector to establish connection, caching GATT services
         2. Creates a background task for connection maintenance
         3. Returns the client for use in other operations
 
@@ -540,9 +637,14 @@ class GoveeBLE:
         """
 
         # Establish connection using bleak_retry_connector
-        # This handles connection retries and error recovery automatically
+        # This handles connection retries and error recovery automatically.
+        # BleakClientWithServiceCache reuses the GATT services resolved on a
+        # previous connection, so reconnects skip service discovery.
         client = await brc.establish_connection(
-            BleakClient, ble_device, identifier, max_attempts=GoveeBLE.BLE_HANDLE_RETRY
+            brc.BleakClientWithServiceCache,
+            ble_device,
+            identifier,
+            max_attempts=GoveeBLE.BLE_HANDLE_RETRY,
         )
 
         # Create a background task to keep the BLE connection active
@@ -570,7 +672,7 @@ class GoveeBLE:
             None
 
         The keepalive loop:
-        1. Waits 1 second (BLE_KEEPALIVE_INTERVAL)
+        1. Waits until nothing was written for 1 second (BLE_KEEPALIVE_INTERVAL)
         2. Ensures client is connected (reconnects if needed)
         3. Sends a keepalive packet
         4. Continues indefinitely until stopped (homeassistant shutdown or device removed)
@@ -581,10 +683,21 @@ class GoveeBLE:
         0xaa is a known documented header type to describe a keepalive packet.
         """
 
+        loop = asyncio.get_running_loop()
+
         # Loop forever as a background task
         while True:
-            # Delay to avoid the loop spamming BLE packets
-            await asyncio.sleep(GoveeBLE.BLE_KEEPALIVE_INTERVAL)
+            # Sleep until the client has been idle for a full keepalive interval.
+            # Any frame written in the meantime moves that deadline back, so no
+            # keepalive is sent while commands are already keeping the link busy.
+            delay = GoveeBLE.BLE_KEEPALIVE_INTERVAL
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = (
+                    GoveeBLE._LAST_WRITE.get(client, 0.0)
+                    + GoveeBLE.BLE_KEEPALIVE_INTERVAL
+                    - loop.time()
+                )
 
             # Keep inside try block to avoid the loop dying
             try:
@@ -615,3 +728,20 @@ class GoveeBLE:
         for b in data:
             checksum ^= b
         return checksum & 0xFF
+
+
+# Plain int aliases of the enum values used when building and parsing packets.
+# Hot paths use these instead of walking GoveeBLE.LEDCommand etc. per packet.
+CMD_POWER = GoveeBLE.LEDCommand.POWER.value
+CMD_BRIGHTNESS = GoveeBLE.LEDCommand.BRIGHTNESS.value
+CMD_COLOR = GoveeBLE.LEDCommand.COLOR.value
+CMD_SEGMENT = GoveeBLE.LEDCommand.SEGMENT.value
+MODE_MANUAL = GoveeBLE.LEDMode.MANUAL.value
+MODE_SEGMENTS = GoveeBLE.LEDMode.SEGMENTS.value
+FRAME_REQUEST = GoveeBLE.LEDFrameType.REQUEST.value
+
+# Frames that never change, built and signed once at import.
+# Keepalive is a request frame with a zero command byte and no payload.
+KEEPALIVE_FRAME = bytes(GoveeBLE.prepare_single_packet(0, [], FRAME_REQUEST))
+POWER_ON_FRAME = bytes(GoveeBLE.prepare_single_packet(CMD_POWER, [0x1]))
+POWER_OFF_FRAME = bytes(GoveeBLE.prepare_single_packet(CMD_POWER, [0x0]))
@@ -22,7 +22,6 @@ from pathlib import Path
 import asyncio
 import logging
 import base64
-import array
 import json
 
 from homeassistant.components import bluetooth
@@ -42,12 +41,24 @@ from homeassistant.helpers.entity import DeviceInfo
 # from homeassistant.helpers.storage import Store
 from homeassistant.core import HomeAssistant
 
-from .govee_ble import GoveeBLE
+from .govee_ble import (
+    GoveeBLE,
+    CMD_POWER,
+    CMD_BRIGHTNESS,
+    CMD_COLOR,
+    CMD_SEGMENT,
+    FRAME_REQUEST,
+    POWER_ON_FRAME,
+)
 from .const import DOMAIN
 from . import Hub
 
 _LOGGER = logging.getLogger(__name__)
 
+# Home Assistant brightness (0-255) to the percentage (0-100) expected by
+# BLE_PERCENT_MODELS, precomputed for every possible value.
+_BRIGHTNESS_TO_PERCENT = bytes(round(value * 100 / 255) for value in range(256))
+
 
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities
@@ -109,6 +120,7 @@ class GoveeBluetoothLight(LightEntity):
     Attributes:
         _client: BleakClient instance for BLE communication
         _mac: Device MAC address
+        _unique_id: MAC address without colons, used as the entity unique ID
         _model: Govee light model identifier
         _is_segmented: Whether device uses segmented LED control
         _use_percent: Whether device uses percentage brightness
@@ -145,6 +157,8 @@ class GoveeBluetoothLight(LightEntity):
 
         # Initialize variables.
         self._mac = hub.address
+        # Home Assistant reads unique_id often; the address never changes
+        self._unique_id = self._mac.replace(":", "")
         self._model = config_entry.data["model"]
         self._is_segmented = self._model in GoveeBLE.BLE_SEGMENTED_MODELS
         self._use_percent = self._model in GoveeBLE.BLE_PERCENT_MODELS
@@ -342,7 +356,7 @@ class GoveeBluetoothLight(LightEntity):
         Returns:
             str: MAC address with colons removed (e.g., "aa:bb:cc:dd:ee:ff" -> "aabbccddeeff")
         """
-        return self._mac.replace(":", "")
+        return self._unique_id
 
     @property
     def brightness(self):
@@ -374,6 +388,52 @@ class GoveeBluetoothLight(LightEntity):
         """
         return self._state
 
+    def _build_turn_on_frames(self, kwargs) -> list:
+        """
+        Build the power, brightness and color frames for a turn_on call.
+
+        Args:
+            kwargs: The keyword arguments passed to async_turn_on
+
+        Returns:
+            list: Signed frames to write, in order (may be empty)
+        """
+        frames = []
+        brightness = kwargs.get(ATTR_BRIGHTNESS)
+        rgb_color = kwargs.get(ATTR_RGB_COLOR)
+
+        # Send power-on first, unless we're setting an effect
+        # Effect data should be loaded before activation
+        if ATTR_EFFECT not in kwargs:
+            frames.append(POWER_ON_FRAME)
+
+        # Handle brightness setting
+        if brightness is not None:
+            # Some models require a percentage instead of the raw value of a byte.
+            frames.append(
+                GoveeBLE.prepare_single_packet(
+                    CMD_BRIGHTNESS,  # Command
+                    [  # Data
+                        (
+                            _BRIGHTNESS_TO_PERCENT[brightness]
+                            if self._use_percent
+                            else brightness
+                        )
+                    ],
+                )
+            )
+
+        # Handle RGB color setting
+        if rgb_color is not None:
+            red, green, blue = rgb_color
+
+            # Cached color frame for this device type
+            frames.append(
+                GoveeBLE.prepare_color_packet(red, green, blue, self._is_segmented)
+            )
+
+        return frames
+
     async def async_turn_on(self, **kwargs) -> None:
         """
         Turn the light on and optionally set brightness, color, or effect.
@@ -388,10 +448,11 @@ class GoveeBluetoothLight(LightEntity):
             ConnectionError: If device hasn't connected yet
 
         The method:
-        1. Sends power-on command if no effect is specified
-        2. Sets brightness if requested
-        3. Sets RGB color if requested
-        4. Plays effect if requested
+        1. Builds a power-on frame if no effect is specified
+        2. Builds a brightness frame if requested
+        3. Builds an RGB color frame if requested
+        4. Writes those frames back-to-back, then updates entity state
+        5. Plays effect if requested
 
         Note: Effect is always sent before power-on so the device
         activates with the effect already loaded.
@@ -402,70 +463,22 @@ class GoveeBluetoothLight(LightEntity):
                 "This device has not been connected yet. Is it in range?"
             )
 
-        # Send power-on first, unless we're setting an effect
-        # Effect data should be loaded before activation
-        if ATTR_EFFECT not in kwargs:
-            await GoveeBLE.send_single_packet(
-                self._client, GoveeBLE.LEDCommand.POWER, [0x1]
-            )
-            self._state = True
-
-        # Handle brightness setting
-        if ATTR_BRIGHTNESS in kwargs:
-            self._brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
-
-            # Some models require a percentage instead of the raw value of a byte.
-            await GoveeBLE.send_single_packet(
-                self._client,
-                GoveeBLE.LEDCommand.BRIGHTNESS,  # Command
-                [  # Data
-                    (
-                        round(self._brightness * 100 / 255)
-                        if self._use_percent
-                        else self._brightness
-                    )
-                ],
-            )
-
-        # Handle RGB color setting
-        if ATTR_RGB_COLOR in kwargs:
-            red, green, blue = kwargs.get(ATTR_RGB_COLOR)
+        # Power, brightness and color frames are built first and then written
+        # back-to-back in one burst
+        frames = self._build_turn_on_frames(kwargs)
+        if frames:
+            await GoveeBLE.send_frames(self._client, frames)
 
-            if self._is_segmented:
-                # Send segment-specific color command
-                await GoveeBLE.send_single_packet(
-                    self._client,
-                    GoveeBLE.LEDCommand.COLOR,  # Command
-                    [  # Data for segmented device
-                        GoveeBLE.LEDMode.SEGMENTS,
-                        0x01,  # Segment index
-                        red,
-                        green,
-                        blue,  # RGB values
-                        0x00,
-                        0x00,
-                        0x00,
-                        0x00,
-                        0x00,  # Reserved
-                        0xFF,  # Full intensity
-                        0x7F,  # Segment count (default to all)
-                    ],
-                )  # Data
-            else:
-                # Send standard RGB color command
-                await GoveeBLE.send_single_packet(
-                    self._client,
-                    GoveeBLE.LEDCommand.COLOR,  # Command
-                    [  # Data for non-segmented device
-                        GoveeBLE.LEDMode.MANUAL,  # Mode
-                        red,
-                        green,
-                        blue,  # RGB values
-                    ],
-                )  # Data
+        brightness = kwargs.get(ATTR_BRIGHTNESS)
+        rgb_color = kwargs.get(ATTR_RGB_COLOR)
 
-            # Update entity state
-            self._rgb_color = (red, green, blue)
+        # Update entity state once the frames have been written
+        if ATTR_EFFECT not in kwargs:
+            self._state = True
+        if brightness is not None:
+            self._brightness = brightness
+        if rgb_color is not None:
+            self._rgb_color = tuple(rgb_color)
             self._current_effect = EFFECT_OFF
 
         # Handle effect setting
@@ -518,10 +531,8 @@ class GoveeBluetoothLight(LightEntity):
                     await GoveeBLE.send_multi_packet(
                         self._client,
                         0xA3,  # Protocol type for scene commands
-                        array.array("B", [0x02]),  # Header
-                        array.array(
-                            "B", base64.b64decode(specialEffect["scenceParam"])
-                        ),
+                        b"\x02",  # Header
+                        base64.b64decode(specialEffect["scenceParam"]),
                     )
 
                     _LOGGER.debug(
@@ -533,9 +544,7 @@ class GoveeBluetoothLight(LightEntity):
 
                     # Power-on after effect data so the device activates
                     # with the effect already loaded
-                    await GoveeBLE.send_single_packet(
-                        self._client, GoveeBLE.LEDCommand.POWER, [0x1]
-                    )
+                    await GoveeBLE.send_power(self._client, True)
                 except Exception as err:
                     _LOGGER.error("Failed to send effect %r: %s", effect, err)
 
@@ -559,9 +568,7 @@ class GoveeBluetoothLight(LightEntity):
             )
 
         # Send power-off command
-        await GoveeBLE.send_single_packet(
-            self._client, GoveeBLE.LEDCommand.POWER, [0x0]  # 0x00 = off
-        )
+        await GoveeBLE.send_power(self._client, False)
 
         # Clear current effect and state
         self._current_effect = EFFECT_OFF
@@ -618,30 +625,31 @@ class GoveeBluetoothLight(LightEntity):
             return
 
         # Only process responses to state requests (not commands we sent)
-        if head != GoveeBLE.LEDFrameType.REQUEST:
+        if head != FRAME_REQUEST:
             return
 
         # Handle power state change
-        if cmd == GoveeBLE.LEDCommand.POWER:  # Update power state of device
+        if cmd == CMD_POWER:  # Update power state of device
             self._state = payload[0] == 0x01
             if not self._state:
                 self._current_effect = EFFECT_OFF
 
         # Handle brightness change
-        elif cmd == GoveeBLE.LEDCommand.BRIGHTNESS:  # Update brightness of device
-            # Depending on model type, convert percentage/absolute value
+        elif cmd == CMD_BRIGHTNESS:  # Update brightness of device
+            # Depending on model type, convert percentage/absolute value.
+            # Percentages are scaled with integer math, rounding halves up.
             self._brightness = (
-                round(payload[0] * 255 / 100) if self._use_percent else int(payload[0])
+                (payload[0] * 255 + 50) // 100 if self._use_percent else payload[0]
             )
 
         # Handle color change on non-segmented device
-        elif cmd == GoveeBLE.LEDCommand.COLOR:  # Update color of non-segmented device
+        elif cmd == CMD_COLOR:  # Update color of non-segmented device
             if len(payload) >= 4:
                 self._rgb_color = (payload[1], payload[2], payload[3])
                 self._current_effect = EFFECT_OFF
 
         # Handle color change on segmented device
-        elif cmd == GoveeBLE.LEDCommand.SEGMENT:  # Update color of segmented device
+        elif cmd == CMD_SEGMENT:  # Update color of segmented device
             if len(payload) >= 5:
                 self._rgb_color = (payload[2], payload[3], payload[4])
                 self._current_effect = EFFECT_OFF
@@ -710,18 +718,18 @@ class GoveeBluetoothLight(LightEntity):
             # Request power state of device
             await GoveeBLE.send_single_packet(
                 self._client,
-                GoveeBLE.LEDCommand.POWER,
+                CMD_POWER,
                 [],  # Empty payload for request
-                GoveeBLE.LEDFrameType.REQUEST,
+                FRAME_REQUEST,
             )  # Request power state of device
             await asyncio.sleep(0.05)
 
             # Request brightness of device
             await GoveeBLE.send_single_packet(
                 self._client,
-                GoveeBLE.LEDCommand.BRIGHTNESS,
+                CMD_BRIGHTNESS,
                 [],  # Empty payload for request
-                GoveeBLE.LEDFrameType.REQUEST,
+                FRAME_REQUEST,
             )  # Request brightness of device
             await asyncio.sleep(0.05)
 
@@ -730,17 +738,17 @@ class GoveeBluetoothLight(LightEntity):
                 # Segmented device uses SEGMENT command for color request
                 await GoveeBLE.send_single_packet(
                     self._client,
-                    GoveeBLE.LEDCommand.SEGMENT,
+                    CMD_SEGMENT,
                     [0x01],  # Segment index
-                    GoveeBLE.LEDFrameType.REQUEST,
+                    FRAME_REQUEST,
                 )  # Request color of non segmented device
             else:
                 # Non-segmented device uses COLOR command for color request
                 await GoveeBLE.send_single_packet(
                     self._client,
-                    GoveeBLE.LEDCommand.COLOR,
+                    CMD_COLOR,
                     [],  # Empty payload for request
-                    GoveeBLE.LEDFrameType.REQUEST,
+                    FRAME_REQUEST,
                 )  # Request color of segmented device
         except Exception as err:
             # Log as debug - state initialization is not critical